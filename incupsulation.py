@@ -14,18 +14,120 @@ from matplotlib.widgets import Slider, Button, RadioButtons
 from matplotlib.colors import LogNorm, PowerNorm, Normalize
 from matplotlib.patches import Rectangle
 import time
-from numba import jit, prange
+from numba import guvectorize
 
 # ============================================================================
 # ОПТИМИЗИРОВАННАЯ ФУНКЦИЯ РАСЧЕТА ОБЛУЧЕННОСТИ
 # ============================================================================
 
+def cutoff_distance_sq(L_sr2, cutoff_ratio):
+    """
+    Квадрат расстояния r², дальше которого вклад точки источника отбрасывается.
+    
+    Вклад пары относительно точки прямо под источником равен (L_sr² / r²)²,
+    он меньше cutoff_ratio при r² > L_sr² / sqrt(cutoff_ratio), то есть
+    при горизонтальном удалении больше L_sr · sqrt(1/sqrt(cutoff_ratio) - 1).
+    """
+    return np.float32(L_sr2 / np.sqrt(cutoff_ratio))
+
+
+# Размер блока точек строки приемника в ядре (кэш-блокировка)
+TILE_SIZE = 16
+
+
 # Выносим расчетную функцию вне класса для работы с Numba
 # Numba JIT компилятор ускоряет вычисления в 10-100 раз
-@jit(nopython=True, parallel=True, fastmath=True)
-def calculate_irradiance_optimized(X_r, Y_r, x_s_points, y_s_points, L_sr, I_i):
+# Ядро оформлено как обобщенная ufunc (guvectorize) для одной строки приемника:
+# target='parallel' сам распределяет строки по потокам, явный prange не нужен,
+# и каждый поток пишет только в свою строку результата.
+# cache=True сохраняет скомпилированный код на диск, поэтому компиляция
+# выполняется один раз, а не при каждом запуске приложения.
+# Явная сигнатура (float32, непрерывные массивы) компилирует функцию сразу
+# при импорте и исключает вывод типов при первом вызове
+@guvectorize(['void(f4[:, ::1], f4[::1], f4, f4, f4[::1], f4[::1], f4[::1], i8[::1])'],
+             '(k,n),(l),(),()->(n),(),(),()',
+             target='parallel', nopython=True, fastmath=True, cache=True)
+def irradiance_row_kernel(DX2, DYL2_row, C, d_max, row, row_min, row_max, row_argmax):
+    """
+    Расчет облученности одной строки приемника (ядро Numba gufunc).
+    
+    Параметры:
+    ----------
+    DX2 : numpy.ndarray (K, N)
+        Квадраты разностей по X между точками источника и приемника
+    DYL2_row : numpy.ndarray (K,)
+        dy² + L_sr² для текущей строки приемника и точек источника по Y
+    C : numpy.float32
+        Постоянный множитель I_i * L_sr²
+    d_max : numpy.float32
+        Максимальный учитываемый квадрат расстояния r²; более далекие пары
+        отбрасываются из-за пренебрежимо малого вклада
+    
+    Выходные массивы:
+    ----------
+    row : numpy.ndarray (N,)
+        Облученность точек строки (Вт/м²)
+    row_min, row_max, row_argmax : numpy.ndarray (1,)
+        Минимум, максимум и индекс столбца максимума в строке
+    """
+    num_x_s = DX2.shape[0]
+    match_x = DX2.shape[1]
+    num_y_s = DYL2_row.shape[0]
+    
+    # Блок из TILE_SIZE соседних точек строки накапливает вклад всех точек
+    # источника, оставаясь в L1 кэше (и в регистрах) на весь проход,
+    # а внутренний цикл идет по непрерывной строке DX2 и векторизуется
+    tile = np.zeros(TILE_SIZE, dtype=np.float32)
+    
+    # Статистика строки считается в том же проходе, что и облученность,
+    # поэтому отдельный проход по result для min/max/argmax не нужен.
+    # Начальные значения берутся из первой точки строки, а не из ±inf:
+    # при fastmath сравнение с бесконечностью не определено
+    mn = np.float32(0.0)
+    mx = np.float32(0.0)
+    jmx = 0
+    for jb in range(0, match_x, TILE_SIZE):
+        width = min(TILE_SIZE, match_x - jb)
+        for t in range(width):
+            tile[t] = 0.0
+        
+        for b in range(num_y_s):
+            dyl2 = DYL2_row[b]
+            # Уже смещение по Y дальше радиуса отсечения - вся строка
+            # точек источника не дает вклада
+            if dyl2 > d_max:
+                continue
+            for a in range(num_x_s):
+                for t in range(width):
+                    # Квадрат расстояния r² = dx² + dy² + L_sr²
+                    # Расчет облученности по физической модели:
+                    # E = I_i * cos²(α) / r², где cos(α) = L_sr / r
+                    # cos²(α) / r² = L_sr² / r⁴, поэтому корень не нужен
+                    d = DX2[a, jb + t] + dyl2
+                    if d <= d_max:
+                        tile[t] += C / (d * d)
+        
+        # Каждая точка приемника записывается в результат ровно один раз
+        for t in range(width):
+            acc = tile[t]
+            row[jb + t] = acc
+            if jb + t == 0:
+                mn = acc
+                mx = acc
+            elif acc < mn:
+                mn = acc
+            elif acc > mx:
+                mx = acc
+                jmx = jb + t
+    row_min[0] = mn
+    row_max[0] = mx
+    row_argmax[0] = jmx
+
+
+def calculate_irradiance_optimized(x_r, y_r, x_s_points, y_s_points, L_sr, I_i,
+                                   cutoff_ratio=1e-3):
     """
-    Оптимизированная версия расчета облученности с использованием Numba JIT.
+    Оптимизированная версия расчета облученности с использованием Numba.
     
     Физическая модель:
     - Использует закон обратных квадратов: E ∝ 1/r²
@@ -34,59 +136,48 @@ def calculate_irradiance_optimized(X_r, Y_r, x_s_points, y_s_points, L_sr, I_i):
     
     Параметры:
     ----------
-    X_r, Y_r : numpy.ndarray
-        Сетка координат точек приемника (meshgrid)
-    x_s_points, y_s_points : numpy.ndarray
+    x_r, y_r : numpy.ndarray (float32, C-непрерывные)
+        Одномерные массивы координат точек приемника по осям X и Y
+    x_s_points, y_s_points : numpy.ndarray (float32, C-непрерывные)
         Массивы координат точек источника
-    L_sr : float
+    L_sr : numpy.float32
         Расстояние по оси Z между источником и приемником (м)
-    I_i : float
+    I_i : numpy.float32
         Интенсивность излучения на точку источника (Вт/ср)
+    cutoff_ratio : float
+        Порог отсечения: пары источник-приемник, вклад которых меньше
+        cutoff_ratio от вклада точки прямо под источником, не учитываются
     
     Возвращает:
     ----------
-    result : numpy.ndarray
-        Массив облученности для каждой точки приемника (Вт/м²)
+    result : numpy.ndarray (float32)
+        Массив облученности для каждой точки приемника (Вт/м²),
+        строки соответствуют Y, столбцы - X
+    min_irradiance, max_irradiance : numpy.float32
+        Минимальная и максимальная облученность (Вт/м²)
+    i_max, j_max : int
+        Индексы (строка, столбец) точки максимальной облученности
     """
-    # Определяем размер сетки приемника (квадратная сетка)
-    match = X_r.shape[0]
-    result = np.zeros((match, match))
-    
-    # Количество точек источника по осям X и Y
-    num_x_s = len(x_s_points)
-    num_y_s = len(y_s_points)
-    
-    # Параллельный цикл по точкам источника (ускорение через prange)
-    # Для каждой точки источника вычисляем вклад во все точки приемника
-    for i in prange(num_x_s):  # prange позволяет параллельное выполнение
-        for j in range(num_y_s):
-            # Координаты текущей точки источника
-            x_s = x_s_points[i]
-            y_s = y_s_points[j]
-            
-            # Вектор от точки источника к каждой точке приемника
-            # dx и dy - это массивы разностей координат для всех точек приемника
-            dx = X_r - x_s
-            dy = Y_r - y_s
-            
-            # Квадрат расстояния в 3D пространстве
-            # L_sr² - это расстояние по оси Z (вертикальное расстояние)
-            distance_sq = dx**2 + dy**2 + L_sr**2
-            
-            # Косинус угла между нормалью к приемнику и направлением на источник
-            # cos(α) = L_sr / sqrt(dx² + dy² + L_sr²)
-            # Это соответствует косинусному распределению излучения
-            cos_alpha = L_sr / np.sqrt(distance_sq)
-            
-            # Расчет облученности по физической модели:
-            # E = I_i * cos²(α) / r²
-            # где cos²(α) учитывает закон Ламбера для косинусного источника
-            irradiance = I_i * (cos_alpha**2) / distance_sq
-            
-            # Суммируем вклад от всех точек источника
-            result += irradiance
+    # Инварианты по всем точкам источника и приемника
+    # Расчет ведется в одинарной точности (float32): для физического смысла
+    # достаточно ~6 значащих цифр, а в SIMD-регистр помещается вдвое больше чисел
+    L_sr2 = L_sr * L_sr
+    C = I_i * L_sr2
+    d_max = cutoff_distance_sq(L_sr2, cutoff_ratio)
+    
+    # Таблицы инвариантов (внешнее разложение квадрата расстояния):
+    # dx² зависит только от (a, j), а dy² + L_sr² - только от (i, b).
+    # Обе таблицы размером N × K намного меньше полного набора пар
+    DX2 = np.ascontiguousarray((x_s_points[:, None] - x_r[None, :]) ** 2)
+    DYL2 = np.ascontiguousarray((y_r[:, None] - y_s_points[None, :]) ** 2 + L_sr2)
     
-    return result
+    # Строки DYL2 - размерность цикла gufunc, они обрабатываются параллельно
+    result, row_min, row_max, row_argmax = irradiance_row_kernel(DX2, DYL2, C, d_max)
+    
+    # Свертка статистики по строкам - O(N) вместо прохода по всей сетке
+    i_max = np.argmax(row_max)
+    return result, row_min.min(), row_max[i_max], i_max, row_argmax[i_max]
+
 
 # ============================================================================
 # КЛАСС ИНТЕРАКТИВНОГО ПРИЛОЖЕНИЯ
@@ -121,6 +212,9 @@ class InteractiveIrradianceApp:
             Размеры источника: длина и высота (м)
         accuracy : int
             Точность расчета (количество точек разбиения сетки)
+        cutoff_ratio : float
+            Доля от максимального вклада точки источника, ниже которой
+            вклад пары источник-приемник не учитывается
         """
         # ============ ПАРАМЕТРЫ СИСТЕМЫ ============
         self.p = 500  # Мощность источника излучения (Вт)
@@ -132,19 +226,40 @@ class InteractiveIrradianceApp:
         self.l_s = 1  # Длина источника по оси X (м)
         self.h_s = 1  # Высота источника по оси Y (м)
         self.accuracy = 30  # Точность расчета (размер сетки: accuracy × accuracy точек)
+        self.cutoff_ratio = 1e-3  # Порог отсечения пренебрежимо малых вкладов точек источника
         
         # ============ ПАРАМЕТРЫ ВИЗУАЛИЗАЦИИ ============
         self.normalization_type = 'linear'  # Тип нормализации: 'linear', 'log', 'power'
         self.power_gamma = 0.5  # Параметр gamma для power normalization
+        # Кэш объектов нормализации по типу (не создаются заново на каждый кадр)
+        self._norms = {'linear': Normalize(), 'log': LogNorm(), 'power': PowerNorm(self.power_gamma)}
+        self.preview_accuracy = 20  # Точность предварительного расчета во время перетаскивания
         
         # ============ ПЕРЕМЕННЫЕ ДЛЯ ХРАНЕНИЯ РЕЗУЛЬТАТОВ ============
         self.min_irradiance = 0  # Минимальная облученность (Вт/м²)
         self.max_irradiance = 0  # Максимальная облученность (Вт/м²)
         self.result_array = None  # Массив результатов расчета
+        self.max_pos = (0, 0)  # Индексы (строка, столбец) точки максимума
         self.calc_time = 0  # Время последнего расчета (сек)
+        self.calc_accuracy = 0  # Точность, с которой посчитан result_array
+        self._is_interacting = False  # Идет ли перетаскивание слайдера
+        self._last_params = {}  # Параметры, для которых посчитан result_array
+        self._geom_cache_key = None  # Геометрия, для которой построены точки сетки
+        self._geom_cache = None  # Кэш координат точек приемника и источника
         
         # Инициализация интерфейса и первичный расчет
         self.setup_ui()
+        
+        # Таймер для объединения частых событий слайдеров в один расчет
+        self._pending_timer = self.fig.canvas.new_timer(interval=80)
+        self._pending_timer.single_shot = True
+        self._pending_timer.add_callback(self._on_pending)
+        
+        # Таймер окончания перетаскивания: после паузы поле уточняется
+        # с полной точностью
+        self._idle_timer = self.fig.canvas.new_timer(interval=200)
+        self._idle_timer.single_shot = True
+        self._idle_timer.add_callback(self._on_idle)
         self.update()
         
     def setup_ui(self):
@@ -154,9 +269,11 @@ class InteractiveIrradianceApp:
         
         # Левая панель - схема расположения
         self.ax_layout = plt.subplot(1, 2, 1)
+        self.create_layout_artists()
         
         # Правая панель - поле облученности
         self.ax_field = plt.subplot(1, 2, 2)
+        self.create_field_artists()
         
         self.create_sliders()
         self.create_control_buttons()
@@ -164,7 +281,112 @@ class InteractiveIrradianceApp:
         plt.tight_layout()
         plt.subplots_adjust(bottom=0.4, right=0.98)
     
-    def calculate_irradiance_extended_model(self):
+    def create_layout_artists(self):
+        """
+        Создание графических элементов схемы расположения.
+        
+        Прямоугольники, центры, линия соединения, легенда и текстовый блок
+        создаются один раз, а update_layout только изменяет их положение.
+        """
+        self.ax_layout.set_title('Расположение источника и приемника (вид сверху)', fontsize=12)
+        self.ax_layout.set_xlabel('X координата (м)')
+        self.ax_layout.set_ylabel('Y координата (м)')
+        self.ax_layout.grid(True, alpha=0.3)
+        self.ax_layout.set_aspect('equal')
+        
+        # Приемник
+        self.receiver_rect = Rectangle((0, 0), self.l_r, self.h_r, 
+                                       linewidth=2, edgecolor='blue', 
+                                       facecolor='lightblue', alpha=0.3, label='Приемник')
+        self.ax_layout.add_patch(self.receiver_rect)
+        
+        # Источник (центрированный)
+        self.source_rect = Rectangle((self.x - self.l_s/2, self.y - self.h_s/2), self.l_s, self.h_s, 
+                                     linewidth=2, edgecolor='red', 
+                                     facecolor='lightcoral', alpha=0.7, label='Источник')
+        self.ax_layout.add_patch(self.source_rect)
+        
+        # Центры
+        self.receiver_center, = self.ax_layout.plot(self.l_r/2, self.h_r/2, 'bo', markersize=8,
+                                                    label='Центр приемника')
+        self.source_center, = self.ax_layout.plot(self.x, self.y, 'ro', markersize=8,
+                                                  label='Центр источника')
+        
+        # Линия соединения
+        self.center_line, = self.ax_layout.plot([self.x, self.l_r/2], [self.y, self.h_r/2],
+                                                'k--', alpha=0.5, linewidth=1)
+        
+        self.ax_layout.legend(loc='upper right')
+        
+        # Детальная информация с временем расчета
+        self.info_text_layout = self.ax_layout.text(
+            0.02, 0.98, '', transform=self.ax_layout.transAxes,
+            verticalalignment='top', 
+            bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9),
+            fontsize=9, fontfamily='monospace')
+    
+    def create_field_artists(self):
+        """
+        Создание графических элементов поля облученности.
+        
+        Изображение, colorbar и текстовые блоки создаются один раз,
+        а update_display только изменяет их данные и свойства.
+        """
+        self.ax_field.set_xlabel('X координата приемника (м)')
+        self.ax_field.set_ylabel('Y координата приемника (м)')
+        
+        self.im = self.ax_field.imshow(np.zeros((2, 2), dtype=np.float32), cmap='hot',
+                                       aspect='auto', origin='lower', interpolation='bilinear',
+                                       extent=[0, self.l_r, 0, self.h_r])
+        self.cbar = plt.colorbar(self.im, ax=self.ax_field)
+        self.contour = None
+        
+        # Информация об облученности
+        self.info_text_field = self.ax_field.text(
+            0.02, 0.98, '', transform=self.ax_field.transAxes,
+            verticalalignment='top', fontsize=10, fontweight='bold',
+            bbox=dict(boxstyle='round', facecolor='black', alpha=0.8),
+            color='white', fontfamily='monospace')
+        
+        # Информация о настройках
+        self.norm_text_field = self.ax_field.text(
+            0.02, 0.02, '', transform=self.ax_field.transAxes,
+            verticalalignment='bottom', fontsize=9,
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+    
+    def get_grid_points(self, match):
+        """
+        Координаты точек приемника и источника для заданной точности.
+        
+        Массивы пересоздаются только при изменении геометрии или точности,
+        иначе возвращается кэшированный результат.
+        
+        Возвращает:
+        ----------
+        tuple of numpy.ndarray
+            (x_r, y_r, x_s_points, y_s_points) - непрерывные массивы float32
+        """
+        key = (self.l_s, self.h_s, self.x, self.y, match, self.l_r, self.h_r)
+        if key == self._geom_cache_key:
+            return self._geom_cache
+        
+        # Создаем сетку точек приемника
+        x_r = np.linspace(0, self.l_r, match)
+        y_r = np.linspace(0, self.h_r, match)
+        
+        # Адаптивное количество точек источника в зависимости от размера
+        source_points_factor = max(2, min(10, match // 10))
+        x_s_points = np.linspace(-self.l_s/2, self.l_s/2, source_points_factor) + self.x
+        y_s_points = np.linspace(-self.h_s/2, self.h_s/2, source_points_factor) + self.y
+        
+        # Все массивы приводятся к непрерывным массивам float32 -
+        # это типы из сигнатуры ядра
+        self._geom_cache = tuple(np.ascontiguousarray(points, dtype=np.float32)
+                                 for points in (x_r, y_r, x_s_points, y_s_points))
+        self._geom_cache_key = key
+        return self._geom_cache
+    
+    def calculate_irradiance_extended_model(self, accuracy=None):
         """
         Улучшенная модель расчета облученности с учетом:
         - Закона обратных квадратов для больших расстояний
@@ -178,23 +400,26 @@ class InteractiveIrradianceApp:
         4. Вычисляет вклад каждой точки источника во все точки приемника
         5. Применяет поправку для малых расстояний
         
+        Параметры:
+        ----------
+        accuracy : int, optional
+            Точность расчета; по умолчанию используется self.accuracy
+        
         Возвращает:
         ----------
-        numpy.ndarray
+        result : numpy.ndarray
             Массив облученности размером (accuracy × accuracy)
+        min_irradiance, max_irradiance : float
+            Минимальная и максимальная облученность (Вт/м²)
+        max_pos : tuple
+            Индексы (строка, столбец) точки максимальной облученности
         """
         L_sr = self.R
-        match = self.accuracy
+        match = self.accuracy if accuracy is None else accuracy
         
-        # Создаем сетку точек приемника
-        x_r = np.linspace(0, self.l_r, match)
-        y_r = np.linspace(0, self.h_r, match)
-        X_r, Y_r = np.meshgrid(x_r, y_r, indexing='xy')
-        
-        # Адаптивное количество точек источника в зависимости от размера
-        source_points_factor = max(2, min(10, match // 10))
-        x_s_points = np.linspace(-self.l_s/2, self.l_s/2, source_points_factor) + self.x
-        y_s_points = np.linspace(-self.h_s/2, self.h_s/2, source_points_factor) + self.y
+        # Координаты точек приемника и источника зависят только от геометрии
+        # и точности, поэтому кэшируются (например, при изменении Z)
+        x_r, y_r, x_s_points, y_s_points = self.get_grid_points(match)
         
         # Общая мощность распределяется равномерно по всем точкам источника
         num_source_points = len(x_s_points) * len(y_s_points)
@@ -203,16 +428,25 @@ class InteractiveIrradianceApp:
         # Интенсивность на точку источника
         I_i = power_per_point / np.pi
         
-        # Расчет облученности с использованием оптимизированной функции
-        result = calculate_irradiance_optimized(X_r, Y_r, x_s_points, y_s_points, L_sr, I_i)
+        args = (x_r, y_r, x_s_points, y_s_points,
+                np.float32(L_sr), np.float32(I_i), self.cutoff_ratio)
+        
+        # Расчет облученности ядром Numba (используется для всех размеров сетки)
+        result, min_irr, max_irr, i_max, j_max = calculate_irradiance_optimized(*args)
+        
+        # Для отчета значения переводятся обратно в float64
+        min_irr = float(min_irr)
+        max_irr = float(max_irr)
         
         # Поправка для малых расстояний (когда расстояние сравнимо с размерами)
         if L_sr < max(self.l_s, self.h_s) * 10:
             # Эмпирическая поправка для учета конечных размеров источника
             size_correction = 1.0 + 0.1 * (max(self.l_s, self.h_s) / L_sr)
             result *= size_correction
+            min_irr *= size_correction
+            max_irr *= size_correction
         
-        return result
+        return result, min_irr, max_irr, (int(i_max), int(j_max))
     
     def create_control_buttons(self):
         """Создание кнопок управления визуализацией"""
@@ -288,8 +522,20 @@ class InteractiveIrradianceApp:
             slider.on_changed(self.on_slider_change)
             self.sliders[name] = slider
     
+    def get_model_params(self):
+        """Текущие параметры модели, от которых зависит result_array"""
+        return {'p': self.p, 'x': self.x, 'y': self.y, 'R': self.R,
+                'l_s': self.l_s, 'h_s': self.h_s, 'l_r': self.l_r,
+                'h_r': self.h_r, 'accuracy': self.accuracy}
+    
     def on_slider_change(self, val):
-        """Обновление параметров с проверкой производительности"""
+        """
+        Обновление параметров при изменении слайдеров.
+        
+        Во время перетаскивания слайдер генерирует множество событий,
+        поэтому здесь только запоминаются значения и перезапускается таймер:
+        расчет выполняется один раз, когда события перестают поступать.
+        """
         self.p = self.sliders['slider_power'].val
         self.x = self.sliders['slider_x'].val
         self.y = self.sliders['slider_y'].val
@@ -298,17 +544,51 @@ class InteractiveIrradianceApp:
         self.h_s = self.sliders['slider_hs'].val
         self.l_r = self.sliders['slider_lr'].val
         self.h_r = self.sliders['slider_hr'].val
-        new_accuracy = int(self.sliders['slider_acc'].val)
+        self.accuracy = int(self.sliders['slider_acc'].val)
+        
+        # Перезапуск таймера отложенного обновления
+        self._is_interacting = True
+        self._pending_timer.stop()
+        self._pending_timer.start()
+        self._idle_timer.stop()
+        self._idle_timer.start()
+    
+    def _on_pending(self):
+        """Срабатывание таймера отложенного обновления"""
+        # Таймер Matplotlib снимает обработчик, вернувший 0/False, поэтому
+        # результат _do_update наружу не передается
+        self._do_update()
+    
+    def _on_idle(self):
+        """Окончание перетаскивания: расчет с полной точностью"""
+        self._is_interacting = False
+        if not self._do_update():
+            # Поле не пересчитывалось - перерисовываем его, чтобы вернуть контуры
+            self.update_display()
+    
+    def _do_update(self):
+        """
+        Отложенное обновление с проверкой производительности.
         
-        # Автоматическое обновление только если точность не слишком высокая
-        if new_accuracy <= 50:  # Ограничение для быстрого отклика
-            self.accuracy = new_accuracy
-            self.update()
-        else:
-            # Для высокой точности показываем предупреждение
-            self.accuracy = new_accuracy
+        Возвращает True, если графики были обновлены.
+        """
+        # Определяем, какие параметры изменились с последнего расчета
+        params = self.get_model_params()
+        changed = {name for name, value in params.items()
+                   if self._last_params.get(name) != value}
+        if not changed:
+            return False
+        
+        # Облученность линейна по мощности: пересчет поля не нужен
+        if changed == {'p'} and self.result_array is not None:
+            self.update_power()
+            return True
+        
+        # Для высокой точности показываем предупреждение
+        if self.accuracy > 50 and not self._is_interacting:
             print("⚠️  Высокая точность - расчет может занять время...")
-            self.update()
+        self.update()
+        return True
     
     def update(self):
         """
@@ -323,14 +603,20 @@ class InteractiveIrradianceApp:
         """
         start_time = time.time()
         
-        # Расчет поля облученности
-        result_array = self.calculate_irradiance_extended_model()
-        self.result_array = result_array
+        # Во время перетаскивания слайдера поле считается на грубой сетке,
+        # уточнение выполняется после окончания перетаскивания
+        accuracy = self.accuracy
+        if self._is_interacting:
+            accuracy = min(self.accuracy, self.preview_accuracy)
         
-        # Сохранение статистики облученности
-        self.min_irradiance = np.min(result_array)
-        self.max_irradiance = np.max(result_array)
+        # Расчет поля облученности
+        # Статистика облученности вычисляется вместе с полем
+        (self.result_array, self.min_irradiance, self.max_irradiance,
+         self.max_pos) = self.calculate_irradiance_extended_model(accuracy)
+        self.calc_accuracy = accuracy
         self.calc_time = time.time() - start_time
+        self._last_params = self.get_model_params()
+        self._last_params['accuracy'] = accuracy
         
         # Обновление визуализаций
         self.update_layout()      # Левая панель: схема расположения
@@ -339,50 +625,56 @@ class InteractiveIrradianceApp:
         # Вывод информации о производительности
         self.print_calculation_info()
     
+    def update_power(self):
+        """
+        Обновление при изменении только мощности источника.
+        
+        Облученность пропорциональна мощности, поэтому сохраненный
+        result_array масштабируется без вызова расчетного ядра.
+        """
+        start_time = time.time()
+        
+        scale = self.p / self._last_params['p']
+        self.result_array = self.result_array * np.float32(scale)
+        self.min_irradiance *= scale
+        self.max_irradiance *= scale
+        self.calc_time = time.time() - start_time
+        self._last_params['p'] = self.p
+        
+        self.update_layout()
+        self.update_display()
+        self.print_calculation_info()
+    
     def update_layout(self):
         """Обновление схемы расположения"""
-        self.ax_layout.clear()
-        self.ax_layout.set_title('Расположение источника и приемника (вид сверху)', fontsize=12)
-        self.ax_layout.set_xlabel('X координата (м)')
-        self.ax_layout.set_ylabel('Y координата (м)')
-        self.ax_layout.grid(True, alpha=0.3)
-        self.ax_layout.set_aspect('equal')
-        
         # Приемник
-        receiver_rect = Rectangle((0, 0), self.l_r, self.h_r, 
-                                 linewidth=2, edgecolor='blue', 
-                                 facecolor='lightblue', alpha=0.3, label='Приемник')
-        self.ax_layout.add_patch(receiver_rect)
+        self.receiver_rect.set_width(self.l_r)
+        self.receiver_rect.set_height(self.h_r)
         
         # Источник (центрированный)
-        source_x = self.x - self.l_s/2
-        source_y = self.y - self.h_s/2
-        source_rect = Rectangle((source_x, source_y), self.l_s, self.h_s, 
-                               linewidth=2, edgecolor='red', 
-                               facecolor='lightcoral', alpha=0.7, label='Источник')
-        self.ax_layout.add_patch(source_rect)
+        self.source_rect.set_xy((self.x - self.l_s/2, self.y - self.h_s/2))
+        self.source_rect.set_width(self.l_s)
+        self.source_rect.set_height(self.h_s)
         
         # Центры
-        self.ax_layout.plot(self.l_r/2, self.h_r/2, 'bo', markersize=8, label='Центр приемника')
-        self.ax_layout.plot(self.x, self.y, 'ro', markersize=8, label='Центр источника')
+        self.receiver_center.set_data([self.l_r/2], [self.h_r/2])
+        self.source_center.set_data([self.x], [self.y])
         
         # Линия соединения
-        self.ax_layout.plot([self.x, self.l_r/2], [self.y, self.h_r/2], 'k--', alpha=0.5, linewidth=1)
+        self.center_line.set_data([self.x, self.l_r/2], [self.y, self.h_r/2])
         
         # Границы
         margin = 20
         self.ax_layout.set_xlim(-margin, max(self.l_r, self.x + self.l_s/2) + margin)
         self.ax_layout.set_ylim(-margin, max(self.h_r, self.y + self.h_s/2) + margin)
         
-        self.ax_layout.legend(loc='upper right')
-        
         # Детальная информация с временем расчета
         info_text = (f'Параметры системы:\n'
                     f'• Мощность: {self.p} Вт\n'
                     f'• Расстояние Z: {self.R} м\n'
                     f'• Размер источника: {self.l_s:.1f}×{self.h_s:.1f} м\n'
                     f'• Размер приемника: {self.l_r}×{self.h_r} м\n'
-                    f'• Точек расчета: {self.accuracy}×{self.accuracy}\n'
+                    f'• Точек расчета: {self.calc_accuracy}×{self.calc_accuracy}\n'
                     f'• Время расчета: {self.calc_time:.3f} сек\n\n'
                     f'Облученность:\n'
                     f'• МАКСИМАЛЬНАЯ: {self.max_irradiance:.2e} Вт/м²\n'
@@ -392,54 +684,73 @@ class InteractiveIrradianceApp:
             ratio = self.max_irradiance / self.min_irradiance
             info_text += f'\n• Отношение: {ratio:.1f}'
         
-        self.ax_layout.text(0.02, 0.98, info_text, transform=self.ax_layout.transAxes,
-                           verticalalignment='top', 
-                           bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9),
-                           fontsize=9, fontfamily='monospace')
+        self.info_text_layout.set_text(info_text)
     
     def update_display(self):
         """Обновление отображения поля облученности"""
-        self.ax_field.clear()
         self.ax_field.set_title(f'Поле облученности приемника (расчет: {self.calc_time:.3f} сек)', fontsize=12)
-        self.ax_field.set_xlabel('X координата приемника (м)')
-        self.ax_field.set_ylabel('Y координата приемника (м)')
         
         result_array = self.result_array
         
-        # Выбор нормализации
-        if self.normalization_type == 'log':
-            norm = LogNorm(vmin=max(1e-10, self.min_irradiance), vmax=self.max_irradiance)
-            cmap = 'viridis'
-            cbar_label = 'Облученность (Вт/м²) - лог. шкала'
-        elif self.normalization_type == 'power':
-            norm = PowerNorm(gamma=self.power_gamma, vmin=self.min_irradiance, vmax=self.max_irradiance)
-            cmap = 'plasma'
-            cbar_label = 'Облученность (Вт/м²)'
+        # Выбор нормализации: объекты нормализации создаются один раз,
+        # у них обновляются только границы (и gamma)
+        norm = self._norms[self.normalization_type]
+        with norm.callbacks.blocked():
+            if self.normalization_type == 'log':
+                norm.vmin = max(1e-10, self.min_irradiance)
+                norm.vmax = self.max_irradiance
+                cmap = 'viridis'
+                cbar_label = 'Облученность (Вт/м²) - лог. шкала'
+            elif self.normalization_type == 'power':
+                norm.gamma = self.power_gamma
+                norm.vmin = self.min_irradiance
+                norm.vmax = self.max_irradiance
+                cmap = 'plasma'
+                cbar_label = 'Облученность (Вт/м²)'
+            else:
+                norm.vmin = self.min_irradiance
+                norm.vmax = self.max_irradiance
+                cmap = 'hot'
+                cbar_label = 'Облученность (Вт/м²)'
+        
+        # Отображение: обновляем существующее изображение вместо создания нового.
+        # Палитра меняется только вместе с режимом нормализации; уведомления
+        # set_cmap/set_norm подавляются, и colorbar перерисовывается один раз
+        # через self.im.changed() ниже
+        self.im.set_data(result_array)
+        with self.im.callbacks.blocked():
+            if self.im.get_cmap().name != cmap:
+                self.im.set_cmap(cmap)
+            self.im.set_norm(norm)
+        self.im.set_extent([0, self.l_r, 0, self.h_r])
+        
+        # Билинейная интерполяция пересчитывает изображение под разрешение
+        # экрана на каждой перерисовке: во время перетаскивания и на грубых
+        # сетках она не дает заметной разницы, поэтому используется 'nearest'
+        if self._is_interacting or self.accuracy <= 40:
+            self.im.set_interpolation('nearest')
         else:
-            norm = Normalize(vmin=self.min_irradiance, vmax=self.max_irradiance)
-            cmap = 'hot'
-            cbar_label = 'Облученность (Вт/м²)'
-        
-        # Отображение
-        im = self.ax_field.imshow(result_array, cmap=cmap, aspect='auto', 
-                                 origin='lower', interpolation='bilinear',
-                                 extent=[0, self.l_r, 0, self.h_r], norm=norm)
-        
-        # Colorbar
-        if hasattr(self, 'cbar'):
-            self.cbar.remove()
-        self.cbar = plt.colorbar(im, ax=self.ax_field, label=cbar_label)
-        
-        # Контуры только для умеренной точности (для скорости)
-        if self.accuracy <= 50 and self.max_irradiance > self.min_irradiance and self.min_irradiance > 0:
+            self.im.set_interpolation('bilinear')
+        
+        # Colorbar: обновляется подключенным к изображению обработчиком
+        self.im.changed()
+        self.cbar.set_label(cbar_label)
+        
+        # Контуры только для умеренной точности (для скорости) и не во время
+        # перетаскивания слайдера - они строятся после его окончания.
+        # Предыдущие контуры удаляются, иначе они накапливаются на осях
+        if self.contour is not None:
+            self.contour.remove()
+            self.contour = None
+        if not self._is_interacting and self.accuracy <= 50 and self.max_irradiance > self.min_irradiance and self.min_irradiance > 0:
             if self.normalization_type == 'log':
                 levels = np.logspace(np.log10(self.min_irradiance), np.log10(self.max_irradiance), 6)
             else:
                 levels = np.linspace(self.min_irradiance, self.max_irradiance, 6)
             
-            contour = self.ax_field.contour(result_array, levels=levels[1:-1], 
-                                          colors='white', alpha=0.5, linewidths=0.8,
-                                          extent=[0, self.l_r, 0, self.h_r])
+            self.contour = self.ax_field.contour(result_array, levels=levels[1:-1], 
+                                                 colors='white', alpha=0.5, linewidths=0.8,
+                                                 extent=[0, self.l_r, 0, self.h_r])
         
         # Информация об облученности
         info_text = (f'ОБЛУЧЕННОСТЬ:\n'
@@ -450,24 +761,19 @@ class InteractiveIrradianceApp:
             ratio = self.max_irradiance / self.min_irradiance
             info_text += f'\nотношение: {ratio:.0f}'
             
-            max_pos = np.unravel_index(np.argmax(result_array), result_array.shape)
-            max_x = max_pos[1] * (self.l_r / (self.accuracy - 1)) if self.accuracy > 1 else 0
-            max_y = max_pos[0] * (self.h_r / (self.accuracy - 1)) if self.accuracy > 1 else 0
+            max_pos = self.max_pos
+            max_x = max_pos[1] * (self.l_r / (self.calc_accuracy - 1)) if self.calc_accuracy > 1 else 0
+            max_y = max_pos[0] * (self.h_r / (self.calc_accuracy - 1)) if self.calc_accuracy > 1 else 0
             info_text += f'\nмакс в: ({max_x:.1f}, {max_y:.1f}) м'
         
-        self.ax_field.text(0.02, 0.98, info_text, transform=self.ax_field.transAxes,
-                          verticalalignment='top', fontsize=10, fontweight='bold',
-                          bbox=dict(boxstyle='round', facecolor='black', alpha=0.8),
-                          color='white', fontfamily='monospace')
+        self.info_text_field.set_text(info_text)
         
         # Информация о настройках
         norm_info = f'Нормализация: {self.normalization_type}'
         if self.normalization_type == 'power':
             norm_info += f' (γ={self.power_gamma:.1f})'
         
-        self.ax_field.text(0.02, 0.02, norm_info, transform=self.ax_field.transAxes,
-                          verticalalignment='bottom', fontsize=9,
-                          bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+        self.norm_text_field.set_text(norm_info)
         
         self.fig.canvas.draw_idle()
 
@@ -475,7 +781,7 @@ class InteractiveIrradianceApp:
         """Вывод информации о расчете"""
         performance = "⚡ Быстро" if self.calc_time < 0.1 else "⏱️  Нормально" if self.calc_time < 0.5 else "🐢 Медленно"
         print(f"{performance} | Время: {self.calc_time:.3f} сек | "
-              f"Точки: {self.accuracy}×{self.accuracy} | "
+              f"Точки: {self.calc_accuracy}×{self.calc_accuracy} | "
               f"Облученность: {self.min_irradiance:.2e} - {self.max_irradiance:.2e} Вт/м²")
 
 # Запуск
@@ -5,8 +5,42 @@ from matplotlib.colors import TwoSlopeNorm
 from matplotlib.patches import Rectangle
 import time
 
+# Numba необязательна: без нее сумма по точкам источника (analytic_source=False)
+# выполняется через матричное умножение NumPy
+try:
+    from irradiance_kernels import irradiance_core
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# CuPy необязательна: расчет суммы по точкам источника на GPU
+# включается флагом use_gpu при analytic_source=False
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+# Узлы Гаусса-Лежандра для аналитической модели источника: после замены
+# y_s - Y = L_sr·sh(θ) подынтегральная функция гладкая и ограниченная,
+# 24 узлов достаточно для сходимости до ~1e-7 во всем диапазоне слайдеров
+SOURCE_QUAD_NODES = 24
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(SOURCE_QUAD_NODES)
+
+
 class InteractiveIrradianceApp:
-    def __init__(self):
+    def __init__(self, analytic_source=True, use_gpu=False):
+        """
+        Параметры:
+        ----------
+        analytic_source : bool
+            True - интегрирование по площади источника: точно по x,
+            квадратурой Гаусса по y (точность задает только сетку приемника);
+            False - сумма по match² точкам источника (Numba, NumPy или CuPy)
+        use_gpu : bool
+            Для суммы по точкам источника считать на GPU через CuPy;
+            действует только вместе с analytic_source=False
+        """
         # Начальные параметры
         self.p = 50  # Мощность (Вт)
         self.l_r = 100  # Длина приемника (м)
@@ -17,6 +51,25 @@ class InteractiveIrradianceApp:
         self.l_s = 1  # Длина источника (м)
         self.h_s = 10  # Высота источника (м)
         self.accuracy = 20  # Точность расчета
+        self.preview_accuracy = 12  # Точность расчета во время перетаскивания слайдера
+        self._is_interacting = False  # Идет ли перетаскивание слайдера
+        self._calc_accuracy = None  # Точность, с которой посчитано текущее поле
+        self.use_gpu = use_gpu and CUPY_AVAILABLE  # Расчет на GPU через CuPy
+        self.analytic_source = analytic_source  # Аналитическая модель источника
+        if use_gpu and analytic_source:
+            print("⚠️  use_gpu действует только при analytic_source=False - расчет на CPU")
+        
+        # Буферы, переиспользуемые между обновлениями при неизменной точности
+        self._buf_shape = None  # Точность, под которую выделен self._result
+        self._result = None  # Поле при единичной мощности (match, match)
+        self._D2 = None  # Плоский буфер знаменателей запасного варианта
+        self._grid_cache = {'key': None}  # Сетки точек для текущей геометрии
+        self._layout_key = None  # Геометрия, показанная на схеме расположения
+        
+        # Кэш поля при единичной мощности: расчет линеен по p,
+        # поэтому при изменении только мощности сетка не пересчитывается
+        self._cache = {'key': None, 'result_unit_power': None,
+                       'min_unit_power': None, 'max_unit_power': None}
         
         # Создаем фигуру с двумя подграфиками
         self.fig = plt.figure(figsize=(16, 8))
@@ -24,58 +77,208 @@ class InteractiveIrradianceApp:
         
         # Левая панель - схема расположения
         self.ax_layout = plt.subplot(1, 2, 1)
-        self.ax_layout.set_title('Расположение источника и приемника (вид сверху)')
-        self.ax_layout.set_xlabel('X (м)')
-        self.ax_layout.set_ylabel('Y (м)')
-        self.ax_layout.grid(True, alpha=0.3)
-        self.ax_layout.set_aspect('equal')
+        self.create_layout_artists()
         
         # Правая панель - поле облученности
         self.ax_field = plt.subplot(1, 2, 2)
-        self.ax_field.set_title('Поле облученности приемника')
-        self.ax_field.set_xlabel('Y координата приемника (м)')
-        self.ax_field.set_ylabel('X координата приемника (м)')
+        self.create_field_artists()
         
         # Создаем слайдеры
         self.create_sliders()
         
+        # Таймер для объединения частых событий слайдеров в один расчет
+        self._pending_timer = self.fig.canvas.new_timer(interval=80)
+        self._pending_timer.single_shot = True
+        self._pending_timer.add_callback(self.update)
+        
+        # Таймер окончательного расчета: после паузы поле уточняется
+        # с полной точностью
+        self._quality_timer = self.fig.canvas.new_timer(interval=300)
+        self._quality_timer.single_shot = True
+        self._quality_timer.add_callback(self._on_quality_pass)
+        
         # Первоначальный расчет и отображение
         self.update()
         
         plt.tight_layout()
         plt.subplots_adjust(bottom=0.35, right=0.98)
         
-    def calculate_irradiance_vectorized(self):
-        """Векторизованная версия расчета облученности"""
+    def calculate_irradiance_vectorized(self, accuracy=None):
+        """
+        Векторизованная версия расчета облученности.
+        
+        accuracy - точность расчета, по умолчанию self.accuracy.
+        Возвращает (result, min, max) для текущей мощности
+        """
+        if accuracy is None:
+            accuracy = self.accuracy
+        key = self._field_key(accuracy)
+        if key != self._cache['key']:
+            (self._cache['result_unit_power'], self._cache['min_unit_power'],
+             self._cache['max_unit_power']) = self._calculate_unit_power(accuracy)
+            self._cache['key'] = key
+        
+        # Мощность положительна, поэтому min/max масштабируются вместе с полем
+        return (self.p * self._cache['result_unit_power'],
+                self.p * self._cache['min_unit_power'],
+                self.p * self._cache['max_unit_power'])
+    
+    def _field_key(self, accuracy):
+        """Ключ кэша поля: все параметры, кроме мощности"""
+        return (self.l_r, self.h_r, self.x, self.y, self.R,
+                self.l_s, self.h_s, accuracy)
+    
+    def _calculate_unit_power(self, accuracy):
+        """Расчет поля облученности и его min/max для источника мощностью 1 Вт"""
         L_sr = self.R
-        match = self.accuracy
-        
-        # Создаем сетку точек приемника
-        x_r = np.linspace(0, self.l_r, match)
-        y_r = np.linspace(0, self.h_r, match)
-        X_r, Y_r = np.meshgrid(x_r, y_r)
-        
-        # Создаем сетку точек источника
-        x_s = np.linspace(0, self.l_s, match) + self.x
-        y_s = np.linspace(0, self.h_s, match) + self.y
+        match = accuracy
         
-        P_source = self.p
+        P_source = 1.0
         I_i = P_source / (np.pi * match**2)
         
-        # Векторизованный расчет
-        result = np.zeros((match, match))
-        
-        # Для каждой точки источника суммируем вклад во все точки приемника
-        # i - индекс по Y (строки), j - индекс по X (столбцы)
-        for i in range(match):
-            for j in range(match):
-                dx = X_r - x_s[j]  # X координата источника
-                dy = Y_r - y_s[i]  # Y координата источника
-                L_vect = np.sqrt(dx**2 + dy**2 + L_sr**2)
-                cos_a = L_sr / L_vect
-                result += I_i * cos_a**2 / L_sr**2
-        
-        return result / 0.005
+        # Результат пишется в буфер, который хранится в кэше до следующего
+        # пересчета, поэтому его можно перезаписывать на месте
+        if self._buf_shape != match:
+            self._result = np.empty((match, match), dtype=np.float32)
+            self._buf_shape = match
+        result = self._result
+        
+        if self.analytic_source:
+            return self._calculate_unit_power_analytic(match, L_sr, result)
+        
+        if self.use_gpu:
+            return self._calculate_unit_power_gpu(match, L_sr, I_i)
+        
+        grid = self.get_grid_points(match)
+        
+        if NUMBA_AVAILABLE:
+            # Разделимые таблицы знаменателя (match, match) вместо 4D сетки
+            if 'DX2' not in grid:
+                grid['DX2'] = ((grid['x_r'][:, None] - grid['x_s'][None, :])**2).astype(np.float32)
+                grid['DY2'] = ((grid['y_r'][:, None] - grid['y_s'][None, :])**2).astype(np.float32)
+            DYL2 = grid['DY2'] + np.float32(L_sr**2)
+            vmin, vmax = irradiance_core(grid['DX2'], DYL2, I_i, result)
+            result /= 0.005
+            return result, vmin / 0.005, vmax / 0.005
+        
+        # Запасной вариант без Numba: знаменатели для всех пар точек
+        # приемника и источника одним матричным умножением (BLAS):
+        # |r - s|² + L² = (x_r, y_r, |r|², 1) · (-2x_s, -2y_s, 1, |s|² + L²)
+        if 'R_aug' not in grid:
+            # Координаты отсчитываются от центра приемника, чтобы в float32
+            # не терять точность на вычитании больших чисел
+            x_r = grid['x_r'] - self.l_r / 2
+            y_r = grid['y_r'] - self.h_r / 2
+            x_s = grid['x_s'] - self.l_r / 2
+            y_s = grid['y_s'] - self.h_r / 2
+            
+            # Точки приемника построчно: i - индекс по Y, j - по X
+            Y_r, X_r = np.meshgrid(y_r, x_r, indexing='ij')
+            X_s, Y_s = np.meshgrid(x_s, y_s, indexing='ij')
+            X_r, Y_r, X_s, Y_s = X_r.ravel(), Y_r.ravel(), X_s.ravel(), Y_s.ravel()
+            ones = np.ones(match * match)
+            grid['R_aug'] = np.stack([X_r, Y_r, X_r * X_r + Y_r * Y_r, ones],
+                                     axis=1).astype(np.float32)
+            grid['S_aug'] = np.stack([-2 * X_s, -2 * Y_s, ones, X_s * X_s + Y_s * Y_s],
+                                     axis=1).astype(np.float32)
+            grid['S_norm2'] = grid['S_aug'][:, 3].copy()
+        
+        # cos²(a) / L_sr² = (L_sr / L_vect)² / L_sr² = 1 / L_vect², корень не нужен
+        S_aug = grid['S_aug']
+        np.add(grid['S_norm2'], np.float32(L_sr**2), out=S_aug[:, 3])
+        
+        # Буфер знаменателей выделяется по наибольшей точности и переиспользуется
+        # для меньших через представление его начала
+        n = match * match
+        if self._D2 is None or self._D2.size < n * n:
+            self._D2 = np.empty(n * n, dtype=np.float32)
+        L2 = self._D2[:n * n].reshape(n, n)
+        np.matmul(grid['R_aug'], S_aug.T, out=L2)
+        np.reciprocal(L2, out=L2)
+        np.sum(L2, axis=1, out=result.reshape(n))
+        result *= np.float32(I_i / 0.005)
+        
+        return result, result.min(), result.max()
+    
+    def get_grid_points(self, match):
+        """
+        Координаты точек приемника и источника для заданной точности.
+        
+        Сетки зависят только от геометрии и точности, поэтому хранятся
+        между обновлениями (например, при изменении только расстояния Z).
+        Производные таблицы конкретного способа расчета добавляются в
+        тот же словарь при первом использовании.
+        
+        Возвращает:
+        -----------
+        dict
+            x_r, y_r - оси приемника, x_s, y_s - оси источника (float64)
+        """
+        key = (self.l_r, self.h_r, self.l_s, self.h_s, self.x, self.y, match)
+        if key != self._grid_cache['key']:
+            self._grid_cache = {
+                'key': key,
+                'x_r': np.linspace(0, self.l_r, match),
+                'y_r': np.linspace(0, self.h_r, match),
+                'x_s': np.linspace(0, self.l_s, match) + self.x,
+                'y_s': np.linspace(0, self.h_s, match) + self.y,
+            }
+        return self._grid_cache
+    
+    def _calculate_unit_power_analytic(self, match, L_sr, result):
+        """
+        Облученность от равномерного источника как интеграл по его площади.
+        
+        Сумма I_i по match² точкам источника - это квадратура для
+        E(X, Y) = P / (π·A_src) · ∫∫ dx dy / ((X - x)² + (Y - y)² + L_sr²).
+        По x интеграл берется точно:
+            ∫ dx / ((X - x)² + K) = atan((x - X) / √K) / √K,  K = (Y - y)² + L_sr²
+        После замены y - Y = L_sr·sh(θ) множитель 1/√K сокращается с dy,
+        и остается гладкий интеграл по θ, который считается по Гауссу-Лежандру.
+        Расчет в float64 на массивах (match, match, SOURCE_QUAD_NODES).
+        """
+        L_sr = float(L_sr)
+        grid = self.get_grid_points(match)
+        X_r = grid['x_r']
+        Y_r = grid['y_r']
+        x0, x1 = float(self.x), float(self.x + self.l_s)
+        y0, y1 = float(self.y), float(self.y + self.h_s)
+        
+        # Пределы по θ для каждой строки приемника и узлы квадратуры (i, k)
+        th0 = np.arcsinh((y0 - Y_r) / L_sr)
+        th1 = np.arcsinh((y1 - Y_r) / L_sr)
+        half = ((th1 - th0) / 2)[:, None]
+        theta = (th1 + th0)[:, None] / 2 + half * _GL_NODES[None, :]
+        weights = half * _GL_WEIGHTS[None, :]
+        
+        # √K = L_sr·ch(θ); оси (приемник Y, приемник X, узел)
+        sqrt_K = (L_sr * np.cosh(theta))[:, None, :]
+        F = (np.arctan((x1 - X_r)[None, :, None] / sqrt_K)
+             - np.arctan((x0 - X_r)[None, :, None] / sqrt_K))
+        
+        P_source = 1.0
+        E = np.einsum('ijk,ik->ij', F, weights) * (P_source / (np.pi * self.l_s * self.h_s))
+        result[...] = E / 0.005
+        
+        return result, result.min(), result.max()
+    
+    def _calculate_unit_power_gpu(self, match, L_sr, I_i):
+        """
+        Тот же broadcast-расчет на GPU.
+        
+        Каждая точка приемника независимо суммирует вклад всех точек
+        источника, а на хост копируется только итоговый массив (match, match)
+        """
+        grid = self.get_grid_points(match)
+        Y_r = cp.asarray(grid['y_r'], dtype=cp.float32).reshape(match, 1, 1, 1)
+        X_r = cp.asarray(grid['x_r'], dtype=cp.float32).reshape(1, match, 1, 1)
+        x_s = cp.asarray(grid['x_s'], dtype=cp.float32).reshape(1, 1, match, 1)
+        y_s = cp.asarray(grid['y_s'], dtype=cp.float32).reshape(1, 1, 1, match)
+        
+        L2 = (X_r - x_s)**2 + (Y_r - y_s)**2 + np.float32(L_sr**2)
+        result = cp.reciprocal(L2).sum(axis=(2, 3)) * np.float32(I_i / 0.005)
+        
+        return cp.asnumpy(result), float(result.min()), float(result.max())
     
     def create_sliders(self):
         """Создание слайдеров для управления параметрами"""
@@ -127,22 +330,45 @@ class InteractiveIrradianceApp:
         # Точность расчета
         ax_acc = plt.axes([0.15, slider_y_start + 0*slider_spacing, 0.3, slider_height])
         self.slider_acc = Slider(ax_acc, 'Точность', 5, 50, valinit=self.accuracy, valstep=1, valfmt='%d')
-        self.slider_acc.on_changed(self.on_slider_change)
+        self.slider_acc.on_changed(self.on_accuracy_change)
         
         # Кнопка обновления
         ax_button = plt.axes([0.55, slider_y_start + 1*slider_spacing, 0.1, 0.04])
         self.button_update = Button(ax_button, 'Обновить')
         self.button_update.on_clicked(self.on_button_update)
-        
-        # Переменные для хранения графических элементов
-        self.receiver_rect = None
-        self.source_rect = None
-        self.im_field = None
-        self.cbar = None
-        self.info_text = None
     
     def on_slider_change(self, val):
-        """Обновление параметров при изменении слайдеров"""
+        """
+        Обновление параметров при изменении слайдеров.
+        
+        Во время перетаскивания слайдер генерирует множество событий,
+        поэтому здесь только запоминаются значения и перезапускается таймер:
+        расчет выполняется один раз, когда события перестают поступать.
+        Пока идет перетаскивание, поле считается с пониженной точностью,
+        окончательный расчет выполняет таймер уточнения.
+        """
+        self.read_sliders()
+        self._is_interacting = True
+        
+        # Перезапуск таймеров отложенного обновления и уточнения
+        self._pending_timer.stop()
+        self._pending_timer.start()
+        self._quality_timer.stop()
+        self._quality_timer.start()
+    
+    def on_accuracy_change(self, val):
+        """
+        Изменение точности: поле сразу считается с выбранной точностью,
+        без предварительного грубого расчета.
+        """
+        self.read_sliders()
+        self._is_interacting = False
+        self._quality_timer.stop()
+        self._pending_timer.stop()
+        self._pending_timer.start()
+    
+    def read_sliders(self):
+        """Чтение текущих значений всех слайдеров"""
         self.p = int(self.slider_power.val)
         self.x = self.slider_x.val
         self.y = self.slider_y.val
@@ -152,33 +378,55 @@ class InteractiveIrradianceApp:
         self.l_r = self.slider_lr.val
         self.h_r = self.slider_hr.val
         self.accuracy = int(self.slider_acc.val)
-        
-        # Обновляем отображение
-        self.update()
     
     def on_button_update(self, event):
-        """Принудительное обновление по кнопке"""
+        """Принудительное обновление по кнопке, без ожидания таймера"""
+        self._pending_timer.stop()
+        self._quality_timer.stop()
+        self._is_interacting = False
         self.update()
     
+    def _on_quality_pass(self):
+        """Окончание перетаскивания: расчет с полной точностью"""
+        self._is_interacting = False
+        if self._calc_accuracy != self.accuracy:
+            self.update()
+        else:
+            # Поле не пересчитывалось - возвращаем сглаживание изображения
+            self._im.set_interpolation('bilinear')
+            self.fig.canvas.draw_idle()
+    
     def update(self):
         """Обновление всех графиков"""
         start_time = time.time()
         
+        # Во время перетаскивания поле считается на грубой сетке, но только
+        # если его действительно нужно пересчитывать: при изменении одной
+        # мощности поле полной точности уже есть в кэше и лишь масштабируется
+        accuracy = self.accuracy
+        if self._is_interacting and self._field_key(accuracy) != self._cache['key']:
+            accuracy = min(self.accuracy, self.preview_accuracy)
+        self._calc_accuracy = accuracy
+        
         # Расчет поля облученности
-        result_array = self.calculate_irradiance_vectorized()
+        result_array, min_irradiance, max_irradiance = self.calculate_irradiance_vectorized(accuracy)
         
         # Обновление схемы расположения
         self.update_layout()
         
         # Обновление поля облученности
-        self.update_field(result_array)
+        self.update_field(result_array, min_irradiance, max_irradiance)
         
         calc_time = time.time() - start_time
         print(f"Расчет выполнен за {calc_time:.2f} сек")
     
-    def update_layout(self):
-        """Обновление схемы расположения источника и приемника"""
-        self.ax_layout.clear()
+    def create_layout_artists(self):
+        """
+        Создание графических элементов схемы расположения.
+        
+        Прямоугольники, линия Z, легенда и текстовый блок создаются один раз,
+        а update_layout только изменяет их положение и текст.
+        """
         self.ax_layout.set_title('Расположение источника и приемника (вид сверху)')
         self.ax_layout.set_xlabel('X (м)')
         self.ax_layout.set_ylabel('Y (м)')
@@ -186,60 +434,105 @@ class InteractiveIrradianceApp:
         self.ax_layout.set_aspect('equal')
         
         # Приемник (синий прямоугольник)
-        receiver_rect = Rectangle((0, 0), self.l_r, self.h_r, 
-                                 linewidth=2, edgecolor='blue', 
-                                 facecolor='lightblue', alpha=0.3, label='Приемник')
-        self.ax_layout.add_patch(receiver_rect)
+        self._receiver_rect = Rectangle((0, 0), self.l_r, self.h_r, 
+                                        linewidth=2, edgecolor='blue', 
+                                        facecolor='lightblue', alpha=0.3, label='Приемник')
+        self.ax_layout.add_patch(self._receiver_rect)
         
         # Источник (красный прямоугольник)
-        source_rect = Rectangle((self.x, self.y), self.l_s, self.h_s, 
-                               linewidth=2, edgecolor='red', 
-                               facecolor='lightcoral', alpha=0.5, label='Источник')
-        self.ax_layout.add_patch(source_rect)
+        self._source_rect = Rectangle((self.x, self.y), self.l_s, self.h_s, 
+                                      linewidth=2, edgecolor='red', 
+                                      facecolor='lightcoral', alpha=0.5, label='Источник')
+        self.ax_layout.add_patch(self._source_rect)
         
         # Линия, показывающая расстояние Z
-        self.ax_layout.plot([self.x + self.l_s/2, self.l_r/2], 
-                           [self.y + self.h_s/2, self.h_r/2], 
-                           'k--', linewidth=1, alpha=0.5, label=f'Z={self.R}м')
-        
-        # Установка границ
-        margin = 20
-        self.ax_layout.set_xlim(-margin, max(self.l_r, self.x + self.l_s) + margin)
-        self.ax_layout.set_ylim(-margin, max(self.h_r, self.y + self.h_s) + margin)
+        self._zline, = self.ax_layout.plot([], [], 'k--', linewidth=1, alpha=0.5,
+                                           label=f'Z={self.R}м')
         
-        # Легенда
-        self.ax_layout.legend(loc='upper right')
+        # Легенда; подпись линии Z обновляется в update_layout
+        self._legend = self.ax_layout.legend(loc='upper right')
         
         # Информация о параметрах
-        info = f'Мощность: {self.p} Вт\nZ: {self.R} м\nТочность: {self.accuracy}'
-        self.ax_layout.text(0.02, 0.98, info, transform=self.ax_layout.transAxes,
-                           verticalalignment='top', bbox=dict(boxstyle='round', 
-                           facecolor='wheat', alpha=0.8), fontsize=9)
+        self._info_text = self.ax_layout.text(0.02, 0.98, '', transform=self.ax_layout.transAxes,
+                                              verticalalignment='top', bbox=dict(boxstyle='round', 
+                                              facecolor='wheat', alpha=0.8), fontsize=9)
     
-    def update_field(self, result_array):
-        """Обновление поля облученности"""
-        self.ax_field.clear()
+    def create_field_artists(self):
+        """
+        Создание графических элементов поля облученности.
+        
+        Изображение, colorbar и текстовый блок создаются один раз,
+        а update_field только изменяет их данные и границы нормализации.
+        """
         self.ax_field.set_title('Поле облученности приемника')
         self.ax_field.set_xlabel('X координата приемника (м) - длина')
         self.ax_field.set_ylabel('Y координата приемника (м) - высота')
         
-        # Нормализация
-        min_irradiance = np.min(result_array)
-        max_irradiance = np.max(result_array)
+        # Нормализация создается один раз, у нее обновляются только границы
+        self._norm = TwoSlopeNorm(vmin=0, vcenter=1.0, vmax=2)
+        
+        self._im = self.ax_field.imshow(np.ones((2, 2), dtype=np.float32), cmap='coolwarm',
+                                        origin='lower', interpolation='bilinear',
+                                        extent=[0, self.l_r, 0, self.h_r], norm=self._norm)
+        self.cbar = plt.colorbar(self._im, ax=self.ax_field, label='Облученность нормализированная')
+        
+        # Сетка
+        self.ax_field.grid(True, alpha=0.3)
         
+        # Информация о min/max
+        self._field_text = self.ax_field.text(0.02, 0.98, '', transform=self.ax_field.transAxes,
+                                              verticalalignment='top',
+                                              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+                                              fontsize=10)
+    
+    def update_layout(self):
+        """
+        Обновление схемы расположения источника и приемника.
+        
+        Прямоугольники изменяются на месте (set_bounds); если геометрия не
+        менялась (изменились только мощность или точность), обновляется
+        лишь текстовый блок.
+        """
+        layout_key = (self.l_r, self.h_r, self.x, self.y, self.l_s, self.h_s, self.R)
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self._receiver_rect.set_bounds(0, 0, self.l_r, self.h_r)
+            self._source_rect.set_bounds(self.x, self.y, self.l_s, self.h_s)
+            
+            # Линия, показывающая расстояние Z
+            self._zline.set_data([self.x + self.l_s/2, self.l_r/2], 
+                                 [self.y + self.h_s/2, self.h_r/2])
+            label = f'Z={self.R}м'
+            self._zline.set_label(label)
+            self._legend.get_texts()[-1].set_text(label)
+            
+            # Установка границ
+            margin = 20
+            self.ax_layout.set_xlim(-margin, max(self.l_r, self.x + self.l_s) + margin)
+            self.ax_layout.set_ylim(-margin, max(self.h_r, self.y + self.h_s) + margin)
+        
+        # Информация о параметрах
+        accuracy = f'{self._calc_accuracy}'
+        if self._calc_accuracy != self.accuracy:
+            accuracy += f' из {self.accuracy} (предпросмотр)'
+        self._info_text.set_text(f'Мощность: {self.p} Вт\nZ: {self.R} м\nТочность: {accuracy}')
+    
+    def update_field(self, result_array, min_irradiance, max_irradiance):
+        """Обновление поля облученности по готовым min/max значениям"""
+        # Нормализация
         vmin = min_irradiance
         vmax = max_irradiance
         
-        if vmin <= 1 <= vmax:
-            norm = TwoSlopeNorm(vmin=vmin, vcenter=1.0, vmax=vmax)
-        elif vmax < 1:
-            vmax_sym = 2 - vmin
-            norm = TwoSlopeNorm(vmin=vmin, vcenter=1.0, vmax=vmax_sym)
+        if vmax < 1:
+            vmax = 2 - vmin
         elif vmin > 1:
-            vmin_sym = 2 - vmax
-            norm = TwoSlopeNorm(vmin=vmin_sym, vcenter=1.0, vmax=vmax)
-        else:
-            norm = TwoSlopeNorm(vmin=vmin, vcenter=1.0, vmax=vmax)
+            vmin = 2 - vmax
+        
+        # Границы меняются без промежуточных уведомлений, изображение и
+        # colorbar обновляются один раз ниже
+        with self._norm.callbacks.blocked():
+            self._norm.vmin = vmin
+            self._norm.vmax = vmax
         
         # Отображение поля
         # extent = [x_min, x_max, y_min, y_max]
@@ -250,24 +543,17 @@ class InteractiveIrradianceApp:
         # Устанавливаем adjustable для сохранения пропорций
         self.ax_field.set_aspect(aspect_ratio, adjustable='box')
         
-        im = self.ax_field.imshow(result_array, cmap='coolwarm', aspect=aspect_ratio, 
-                                 origin='lower', interpolation='bilinear',
-                                 extent=[0, self.l_r, 0, self.h_r], norm=norm)
+        self._im.set_data(result_array)
+        self._im.set_extent([0, self.l_r, 0, self.h_r])
         
-        # Colorbar
-        if self.cbar is not None:
-            self.cbar.remove()
-        self.cbar = plt.colorbar(im, ax=self.ax_field, label='Облученность нормализированная')
-        
-        # Сетка
-        self.ax_field.grid(True, alpha=0.3)
+        # Билинейная интерполяция пересчитывает изображение под разрешение
+        # экрана на каждой перерисовке, во время перетаскивания она не нужна
+        self._im.set_interpolation('nearest' if self._is_interacting else 'bilinear')
+        # Уведомление изображения перерисовывает и подключенный colorbar
+        self._im.changed()
         
         # Информация о min/max
-        info_text = f'Min: {min_irradiance:.3e} Вт/м²\nMax: {max_irradiance:.3e} Вт/м²'
-        self.ax_field.text(0.02, 0.98, info_text, transform=self.ax_field.transAxes,
-                          verticalalignment='top',
-                          bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-                          fontsize=10)
+        self._field_text.set_text(f'Min: {min_irradiance:.3e} Вт/м²\nMax: {max_irradiance:.3e} Вт/м²')
         
         self.fig.canvas.draw_idle()
 
@@ -0,0 +1,65 @@
+# Общее ядро Numba для interactive_app.py и main2.py
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def irradiance_core(DX2, DYL2, I_i, out):
+    """
+    Потоковое накопление облученности без 4D временного массива
+
+    Знаменатель раскладывается по осям: dx² зависит только от (j, a),
+    dy² + L_sr² - только от (i, b), поэтому обе части считаются заранее
+    в виде небольших 2D таблиц.
+
+    Параметры:
+    ----------
+    DX2 : ndarray (match, match), float32
+        (x_r[j] - x_s[a])²
+    DYL2 : ndarray (match, match), float32
+        (y_r[i] - y_s[b])² + L_sr²
+    I_i : float
+        Интенсивность одной точки источника
+    out : ndarray (match, match), float32
+        Выходной массив, i - индекс по Y приемника, j - по X
+
+    Возвращает:
+    -----------
+    tuple
+        (минимум, максимум) записанного поля
+    """
+    n_y, k_y = DYL2.shape
+    n_x, k_x = DX2.shape
+    I_i = np.float32(I_i)
+    one = np.float32(1.0)
+
+    # Минимум и максимум по строкам считаются вместе с полем,
+    # чтобы не делать отдельных проходов по результату
+    row_min = np.empty(n_y, dtype=np.float32)
+    row_max = np.empty(n_y, dtype=np.float32)
+
+    # prange только по внешнему циклу: каждая ячейка out пишется одним потоком
+    for i in prange(n_y):
+        # Начальные значения - из первой точки строки, а не ±inf:
+        # при fastmath сравнение с бесконечностью не определено
+        rmin = np.float32(0.0)
+        rmax = np.float32(0.0)
+        for j in range(n_x):
+            acc = np.float32(0.0)
+            for b in range(k_y):
+                # dy² + L_sr² не зависит от a - выносится из внутреннего цикла
+                dyi = DYL2[i, b]
+                for a in range(k_x):
+                    acc += one / (DX2[j, a] + dyi)
+            acc *= I_i
+            out[i, j] = acc
+            if j == 0:
+                rmin = acc
+                rmax = acc
+            else:
+                rmin = min(rmin, acc)
+                rmax = max(rmax, acc)
+        row_min[i] = rmin
+        row_max[i] = rmax
+
+    return row_min.min(), row_max.max()
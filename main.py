@@ -1,88 +1,52 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import TwoSlopeNorm
-from decimal import Decimal, getcontext
-import asyncio
 
 
 
 
-async def ps_from_point(x, y, xs,ys, x_pos, y_pos,L_sr,I_i):
-    xs_actual = xs + x_pos
-    ys_actual = ys + y_pos
-    dx = float(xs_actual - x)
-    dy = float(ys_actual - y)
-    L_vect = np.sqrt(dx**2 + dy**2 + (L_sr)**2)
-    cos_a = L_sr/L_vect
-    return  I_i*cos_a**2/L_sr**2
-
-
-
-async def ps_for_target(x, y, l_s,h_s, xstep_s, ystep_s, x_pos,y_pos,L_sr,I_i):
-    tasks_list = []
-    xs = Decimal('0')
-    while xs < l_s:
-        ys = Decimal('0')
-        while ys < h_s:
-            task = ps_from_point(x, y, xs, ys, x_pos, y_pos, L_sr, I_i)
-            tasks_list.append(task)
-            ys += ystep_s
-        xs += xstep_s
-    
-    # Выполняем все задачи и суммируем результаты
-    results = await asyncio.gather(*tasks_list)
-    return sum(results)
-
-async def ps_for_all(match,l_r,h_r,l_s,h_s, x_pos,y_pos,L_sr,I_i):
-    result = [[0]* match for _ in range(match)]
-    x_step_r = l_r / Decimal(match)
-    y_step_r = h_r / Decimal(match)
-    xstep_s = l_s/ Decimal(match)
-    ystep_s = h_s/Decimal(match)
-    
-    # Собираем все задачи
-    tasks_list = []
-    xi = 0
-    x = Decimal('0')
-    while x < l_r and xi < match:
-        yi = 0
-        y = Decimal('0')
-        while y < h_r and yi < match:
-            task = ps_for_target(x, y, l_s, h_s, xstep_s, ystep_s, x_pos, y_pos, L_sr, I_i)
-            tasks_list.append((task, xi, yi))
-            yi += 1
-            y += y_step_r
-        xi += 1
-        x += x_step_r
+def calculate_irradiance(match,l_r,h_r,l_s,h_s, x_pos,y_pos,L_sr,I_i):
+    # Точки приемника и источника с шагом l/match, оси для broadcasting:
+    # (приемник X, приемник Y, источник X, источник Y)
+    x = np.linspace(0, l_r, match, endpoint=False).reshape(match, 1, 1, 1)
+    y = np.linspace(0, h_r, match, endpoint=False).reshape(1, match, 1, 1)
+    xs = (np.linspace(0, l_s, match, endpoint=False) + x_pos).reshape(1, 1, match, 1)
+    ys = (np.linspace(0, h_s, match, endpoint=False) + y_pos).reshape(1, 1, 1, match)
     
-    # Выполняем все задачи
-    for task, xi, yi in tasks_list:
-        result[xi][yi] = await task
+    # I_i*cos_a**2/L_sr**2 = I_i/L_vect**2, корень не нужен
+    # Вклад всех точек источника суммируется по осям источника
+    # Квадраты считаются на малых массивах, 4D массив выделяется один раз:
+    # сумма, L_sr**2 и обратная величина записываются в него на месте
+    dx = xs - x
+    dy = ys - y
+    D2 = np.add(dx*dx, dy*dy)
+    D2 += L_sr*L_sr
+    np.reciprocal(D2, out=D2)
+    result = D2.sum(axis=(2, 3))
+    result *= I_i
     
-    print(f"Результат: {len(result)}x{len(result[0])}")
+    print(f"Результат: {result.shape[0]}x{result.shape[1]}")
     return result
     
 
 
 
 
-async def main(p:int,l_r:str = "100", h_r:str = "100",x="0", y="100", R:int = 30,l_s:str = "1", h_s:str="10",accuracy: int = 10):
-    getcontext().prec = 28
+def main(p:int,l_r:str = "100", h_r:str = "100",x="0", y="100", R:int = 30,l_s:str = "1", h_s:str="10",accuracy: int = 10):
     L_sr = R #м
     match = accuracy
     #Размер косинусного источника света прямоугольник 
-    a = Decimal(l_s) #м
-    b = Decimal(h_s) #м
-    x_pos = Decimal(x)
-    y_pos = Decimal(y)
+    a = float(l_s) #м
+    b = float(h_s) #м
+    x_pos = float(x)
+    y_pos = float(y)
     #Размер приемника света прямоугольник
-    c = Decimal(l_r) #м
-    d = Decimal(h_r) #м
+    c = float(l_r) #м
+    d = float(h_r) #м
     P_source = p #Вт
     I_i = P_source/(np.pi * match**2)#Вт/ср
-    result_array = await ps_for_all(match,c,d,a,b, x_pos, y_pos, L_sr, I_i)
-    # Преобразуем результат в numpy массив для удобства работы
-    result_array = np.array(result_array)/0.005 # максимальная плотность мощности при 10м и 10 вт 
+    result_array = calculate_irradiance(match,c,d,a,b, x_pos, y_pos, L_sr, I_i)
+    result_array = result_array/0.005 # максимальная плотность мощности при 10м и 10 вт 
     #нормализируем
 
 
@@ -120,7 +84,8 @@ async def main(p:int,l_r:str = "100", h_r:str = "100",x="0", y="100", R:int = 30
     colormap = 'coolwarm'
 
     # Создаем визуализацию
-    plt.figure(figsize=(float(c), float(d)))
+    # Размер фигуры фиксирован: пропорции поля задают extent и aspect
+    plt.figure(figsize=(10, 8))
 
     # Создаем цветовую карту поля облученности
     # Используем стандартную diverging colormap с нормализацией относительно 1
@@ -145,5 +110,5 @@ async def main(p:int,l_r:str = "100", h_r:str = "100",x="0", y="100", R:int = 30
 
 
 
-asyncio.run(main(100))
+main(100)
     
\ No newline at end of file
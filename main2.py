@@ -1,55 +1,45 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import TwoSlopeNorm
+from irradiance_kernels import irradiance_core
 
 def calculate_irradiance_vectorized(p, l_r=100, h_r=100, x=0, y=0, R=30, 
                                    l_s=1, h_s=10, accuracy=20):
     """
-    Векторизованная версия расчета облученности
+    Векторизованная версия расчета облученности.
+    Возвращает (result, min, max)
     """
     L_sr = R
     match = accuracy
     
-    # Создаем сетку точек приемника
-    x_r = np.linspace(0, float(l_r), match)
-    y_r = np.linspace(0, float(h_r), match)
-    X_r, Y_r = np.meshgrid(x_r, y_r)
-    
-    # Создаем сетку точек источника
-    x_s = np.linspace(0, float(l_s), match) + float(x)
-    y_s = np.linspace(0, float(h_s), match) + float(y)
-    X_s, Y_s = np.meshgrid(x_s, y_s)
-    
     P_source = p
     I_i = P_source / (np.pi * match**2)
     
-    # Векторизованный расчет
-    result = np.zeros((match, match))
+    # cos²(a) / L_sr² = (L_sr / L_vect)² / L_sr² = 1 / L_vect², корень не нужен
+    # Разделимые таблицы знаменателя (match, match) вместо 4D сетки
+    x_r = np.linspace(0, float(l_r), match, dtype=np.float32)
+    y_r = np.linspace(0, float(h_r), match, dtype=np.float32)
+    x_s = np.linspace(0, float(l_s), match, dtype=np.float32) + np.float32(x)
+    y_s = np.linspace(0, float(h_s), match, dtype=np.float32) + np.float32(y)
+    DX2 = (x_r[:, None] - x_s[None, :])**2
+    DYL2 = (y_r[:, None] - y_s[None, :])**2 + np.float32(float(L_sr)**2)
     
-    # Для каждой точки источника суммируем вклад во все точки приемника
-    for i in range(match):
-        for j in range(match):
-            dx = X_r - x_s[i]
-            dy = Y_r - y_s[j]
-            L_vect = np.sqrt(dx**2 + dy**2 + L_sr**2)
-            cos_a = L_sr / L_vect
-            result += I_i * cos_a**2 / L_sr**2
+    result = np.empty((match, match), dtype=np.float32)
+    vmin, vmax = irradiance_core(DX2, DYL2, I_i, result)
     
-    return result / 0.005
+    return result / 0.005, vmin / 0.005, vmax / 0.005
 
 def main_vectorized(p: int, l_r: str = "20", h_r: str = "20", x="20", y="20", 
                    R: int = 30, l_s: str = "1", h_s: str = "1", accuracy: int = 10):
     """
     Основная функция с векторизованными вычислениями
     """
-    result_array = calculate_irradiance_vectorized(
+    result_array, min_irradiance, max_irradiance = calculate_irradiance_vectorized(
         p, float(l_r), float(h_r), float(x), float(y), R, 
         float(l_s), float(h_s), accuracy
     )
     
     # Визуализация (остается без изменений)
-    min_irradiance = np.min(result_array)
-    max_irradiance = np.max(result_array)
     print(f"Max result: {max_irradiance}")
     
     vmin = min_irradiance
@@ -66,7 +56,8 @@ def main_vectorized(p: int, l_r: str = "20", h_r: str = "20", x="20", y="20",
     else:
         norm = TwoSlopeNorm(vmin=vmin, vcenter=1.0, vmax=vmax)
     
-    plt.figure(figsize=(float(l_r), float(h_r)))
+    # Размер фигуры фиксирован: пропорции поля задают extent и aspect
+    plt.figure(figsize=(10, 8))
     im = plt.imshow(result_array, cmap='coolwarm', aspect='auto', origin='lower', 
                     interpolation='bilinear', extent=[0, float(h_r), 0, float(l_r)],
                     norm=norm)